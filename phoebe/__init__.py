@@ -25,10 +25,17 @@ import inspect as _inspect
 import multiprocessing as _multiprocessing
 import atexit
 import re
+from functools import lru_cache as _lru_cache
 
 # People shouldn't import Phoebe from the installation directory (inspired upon
 # pymc warning message).
-if _os.getcwd().find(_os.path.abspath(_os.path.split(_os.path.split(__file__)[0])[0]))>-1:
+_pkg_parent = _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))
+try:
+    _in_source_tree = _os.path.commonpath([_os.getcwd(), _pkg_parent]) == _pkg_parent
+except ValueError:
+    # paths on different drives (windows)
+    _in_source_tree = False
+if _in_source_tree:
     # We have a clash of package name with the standard library: we implement an
     # "io" module and also they do. This means that you can import Phoebe from its
     # main source tree; then there is no difference between io from here and io
@@ -37,6 +44,7 @@ if _os.getcwd().find(_os.path.abspath(_os.path.split(_os.path.split(__file__)[0]
     # is uniformative to the unexperienced user), we raise the importError here
     # with a helpful error message
     raise ImportError('\n\tYou cannot import Phoebe from inside its main source tree.\n')
+del _pkg_parent, _in_source_tree
 
 def _env_variable_string_or_list(key, default):
     value = _os.getenv(key, default)
@@ -45,6 +53,9 @@ def _env_variable_string_or_list(key, default):
     else:
         return value
 
+# NOTE: the parsed values of the (hashable-valued) helpers below are cached.
+# Settings.reset clears these caches so that it still re-reads the environment.
+@_lru_cache(maxsize=None)
 def _env_variable_int(key, default):
     value = _os.getenv(key, default)
 
@@ -58,6 +69,7 @@ def _env_variable_int_or_none(key, default):
         value = float(value)
     return int(value)
 
+@_lru_cache(maxsize=None)
 def _env_variable_bool(key, default):
     value = _os.getenv(key, default)
     if isinstance(value, bool):
@@ -67,6 +79,9 @@ def _env_variable_bool(key, default):
     else:
         return False
 
+# platforms which do not rely on X (and so do not set DISPLAY)
+_NON_X_PLATFORMS = frozenset(('win32', 'cygwin'))
+
 # If we try to load matplotlib.pyplot on a non-X system, it will fail
 # unless 'Agg' is used before the import. All X-systems define the
 # 'DISPLAY' environment variable, and all non-X-systems do not. We do make a
@@ -78,7 +93,7 @@ if _env_variable_bool('PHOEBE_ENABLE_PLOTTING', True):
         pass
         # we'll catch this later in plotting and throw warnings as necessary
     else:
-        if 'DISPLAY' not in _os.environ.keys() and _sys.platform not in ['win32','cygwin']:
+        if 'DISPLAY' not in _os.environ and _sys.platform not in _NON_X_PLATFORMS:
             matplotlib.use('Agg')
         elif hasattr(_sys, 'real_prefix'):
             # then we're likely in a virtualenv.  Our best bet is to use the 'TkAgg'
@@ -102,13 +117,18 @@ _logger.addHandler(logging.NullHandler())
 # processors into a wait loop.  This must happen before we start importing from
 # phoebe so that those can have access to the _mpi object.
 
+# environment variables set by (openmpi, mvapich2, mpich/intel) mpirun
+_MPI_SIZE_VARS = ('OMPI_COMM_WORLD_SIZE', 'MV2_COMM_WORLD_SIZE', 'PMI_SIZE')
+
 class MPI(object):
+    __slots__ = ('_within_mpirun', '_internal_mpi', '_comm', '_node_comm',
+                 '_leader_comm', '_myrank', '_nprocs', '_enabled')
+
     def __init__(self):
         # this is a bit of a hack and will only work with openmpi, but environment
         # variables seem to be the only way to detect whether the script was run
         # via mpirun or not
-        evars = _os.environ.keys()
-        if 'OMPI_COMM_WORLD_SIZE' in evars or 'MV2_COMM_WORLD_SIZE' in evars or 'PMI_SIZE' in evars:
+        if any(evar in _os.environ for evar in _MPI_SIZE_VARS):
             from mpi4py import MPI as mpi4py
             self._within_mpirun = True
             self._internal_mpi = True
@@ -120,12 +140,21 @@ class MPI(object):
             if self._nprocs==1:
                 raise ImportError("need more than 1 processor to run with mpi")
 
+            # communicators within each (shared-memory) node and between the
+            # lowest rank on each node, so that broadcasts only need to cross
+            # between nodes once (see MPI.bcast)
+            self._node_comm = self.comm.Split_type(mpi4py.COMM_TYPE_SHARED, key=self._myrank)
+            leader_comm = self.comm.Split(0 if self._node_comm.Get_rank()==0 else mpi4py.UNDEFINED, key=self._myrank)
+            self._leader_comm = leader_comm if leader_comm != mpi4py.COMM_NULL else None
+
             self._enabled = _env_variable_bool("PHOEBE_ENABLE_MPI", True)
 
         else:
             self._within_mpirun = False
             self._internal_mpi = False
             self._comm = None
+            self._node_comm = None
+            self._leader_comm = None
             self._myrank = 0
             self._nprocs = _env_variable_int("PHOEBE_MPI_NPROCS", 4)
 
@@ -163,7 +192,7 @@ class MPI(object):
 
     def off(self):
         if self.within_mpirun and self.myrank == 0:
-            self.comm.bcast({'worker_command': 'release'}, root=0)
+            self.bcast({'worker_command': 'release'})
 
         self._enabled = False
 
@@ -181,7 +210,7 @@ class MPI(object):
     @nprocs.setter
     def nprocs(self, nprocs):
         if self.within_mpirun:
-            _logger.warning("ignoring setting nprocs while within mpirun, nprocs={}".format(self.nprocs))
+            _logger.warning("ignoring setting nprocs while within mpirun, nprocs=%s", self.nprocs)
         else:
             self._nprocs = nprocs
 
@@ -189,6 +218,21 @@ class MPI(object):
     def comm(self):
         return self._comm
 
+    def bcast(self, obj=None):
+        """
+        Broadcast `obj` from rank 0 to all processors.  This is a collective
+        call and so must be made by all processors (the value of `obj` is
+        ignored on all but rank 0).
+
+        The object is first broadcast between the lowest rank of each node
+        (which includes rank 0) and then within each node, so that only a
+        single message per node crosses the network.
+        """
+        if self._leader_comm is not None and self._leader_comm.Get_size() > 1:
+            obj = self._leader_comm.bcast(obj, root=0)
+
+        return self._node_comm.bcast(obj, root=0)
+
     @property
     def within_mpirun(self):
         return self._within_mpirun
@@ -201,14 +245,16 @@ class MPI(object):
         # TODO: allow this as an option in the settings?
         python = 'python3'
 
+        # NOTE: the returned command is itself a template, with {} left as
+        # the placeholder for the script to run
         if self.enabled:
-            return 'mpiexec -np %d %s {}' % (self.nprocs, python)
+            return 'mpiexec -np {} {} {{}}'.format(self.nprocs, python)
         else:
-            return '%s {}' % python
+            return '{} {{}}'.format(python)
 
     def shutdown_workers(self):
         if self.within_mpirun and self.myrank == 0:
-            self.comm.bcast({'worker_command': 'shutdown'}, root=0)
+            self.bcast({'worker_command': 'shutdown'})
             self._enabled = False
             # even though technically not true, we're now strictly serial and have no way of regaining the workers
             self._within_mpirun = False
@@ -228,13 +274,11 @@ mpi = MPI()
 ###############################################################################
 
 class Settings(object):
-    def __init__(self):
-        # Check to see whether in interactive mode
-        import __main__
-        # hasattr(__main__, '__file__') will be True if running a python script, but
-        # false if in a python or ipython interpreter.
-        # _sys.flags.interactive will be 1 if the -i flag is sent to python
+    __slots__ = ('_interactive_constraints', '_interactive_checks',
+                 '_download_passband_defaults', '_update_passband_ignore_version',
+                 '_multiprocessing_nprocs', '_progressbars', '_devel')
 
+    def __init__(self):
         # For now we'll set interactive_constraints to True by default, requiring it to
         # explicitly be disabled.
         # See #154 (https://github.com/phoebe-project/phoebe2/issues/154)
@@ -258,6 +302,8 @@ class Settings(object):
         return "<Settings interactive_checks={} interactive_constraints={}>".format(self.interactive_checks, self.interactive_constraints)
 
     def reset(self):
+        _env_variable_int.cache_clear()
+        _env_variable_bool.cache_clear()
         self.__init__()
 
     def interactive_on(self):
@@ -428,32 +474,37 @@ def logger(*args, **kwargs):
     """
     if mpi.within_mpirun and mpi.myrank == 0:
         # tell the workers to invoke the same logger
-        mpi.comm.bcast({'worker_command': 'logger', 'args': args, 'kwargs': kwargs}, root=0)
+        mpi.bcast({'worker_command': 'logger', 'args': args, 'kwargs': kwargs})
 
     return _utils.get_basic_logger(*args, **kwargs)
 
 
 if mpi.within_mpirun and mpi.enabled and mpi.myrank != 0:
+    # neither of these change while waiting for packets
+    _myrank, _nprocs = mpi.myrank, mpi.nprocs
+
     while True:
-        packet = mpi.comm.bcast(None, root=0)
+        packet = mpi.bcast()
+        worker_command = packet.get('worker_command', None)
+        backend_name = packet.get('backend', None) if worker_command is None else None
 
-        if packet.get('worker_command', False) == 'shutdown':
-            _logger.debug("rank:{}/{} message to shutdown".format(mpi.myrank, mpi.nprocs))
+        if worker_command == 'shutdown':
+            _logger.debug("rank:%d/%d message to shutdown", _myrank, _nprocs)
             exit()
 
-        if packet.get('worker_command', False) == 'release':
-            _logger.debug("rank:{}/{} message to release".format(mpi.myrank, mpi.nprocs))
+        elif worker_command == 'release':
+            _logger.debug("rank:%d/%d message to release", _myrank, _nprocs)
             break
 
-        elif packet.get('worker_command', False) == 'logger':
-            _logger.debug("rank:{}/{} message to invoke logger".format(mpi.myrank, mpi.nprocs))
+        elif worker_command == 'logger':
+            _logger.debug("rank:%d/%d message to invoke logger", _myrank, _nprocs)
             logger(*packet['args'], **packet['kwargs'])
 
-        elif hasattr(_backends, packet.get('backend', False)):
+        elif isinstance(backend_name, str) and hasattr(_backends, backend_name):
             backend = getattr(_backends, packet.pop('backend'))()
             backend._run_worker(packet)
 
-        elif hasattr(_solverbackends, packet.get('backend', False)):
+        elif isinstance(backend_name, str) and hasattr(_solverbackends, backend_name):
             backend = getattr(_solverbackends, packet.pop('backend'))()
             backend._run_worker(packet)
 
@@ -841,7 +892,10 @@ def progressbars_off():
     conf.progressbars_off()
 
 # let's use magic to shutdown the workers when the user-script is complete
-atexit.register(mpi.shutdown_workers)
+# (shutdown_workers is a no-op unless we're the master within mpirun, which
+# can't become True later, so there is no need to register it otherwise)
+if mpi.within_mpirun and mpi.myrank == 0:
+    atexit.register(mpi.shutdown_workers)
 
 # edit API docs for imported functions
 
@@ -850,42 +904,20 @@ def strip_docstring_refs(matchobj):
     path = text[1:-1]
     return path
 
-def add_nparray_docstring(obj):
-
-    docsprefix = """This is an included dependency from [nparray 1.2.0](https://nparray.readthedocs.io/en/1.2.0/).\n\n===============================================================\n\n"""
-
-    docstring = docsprefix + "\n".join([l.lstrip() for l in obj.__doc__.split("\n")])
-    docstring = re.sub(r"(?P<name>\<[0-9a-zA-Z_\.]*\>)", strip_docstring_refs, docstring)
-
-    obj.__doc__ = docstring
-
-add_nparray_docstring(array)
-add_nparray_docstring(linspace)
-add_nparray_docstring(arange)
-add_nparray_docstring(logspace)
-add_nparray_docstring(geomspace)
-add_nparray_docstring(invspace)
-
-
-def add_distl_docstring(obj):
-    docsprefix = """This is an included dependency from [distl](https://distl.readthedocs.io).\n\n===============================================================\n\n"""
-
-    docstring = docsprefix + "\n".join([l.lstrip() for l in obj.__doc__.split("\n")])
-    docstring = re.sub(r"(?P<name>\<[0-9a-zA-Z_\.]*\>)", strip_docstring_refs, docstring)
+def add_dependency_docstrings(objs, docsprefix):
+    refs = re.compile(r"(?P<name>\<[0-9a-zA-Z_\.]*\>)")
+    for obj in objs:
+        docstring = docsprefix + "\n".join(l.lstrip() for l in obj.__doc__.split("\n"))
+        obj.__doc__ = refs.sub(strip_docstring_refs, docstring)
 
-    obj.__doc__ = docstring
+add_dependency_docstrings((array, linspace, arange, logspace, geomspace, invspace),
+                          """This is an included dependency from [nparray 1.2.0](https://nparray.readthedocs.io/en/1.2.0/).\n\n===============================================================\n\n""")
 
-add_distl_docstring(uniform)
-add_distl_docstring(boxcar)
-# add_distl_docstring(delta)
-add_distl_docstring(gaussian)
-add_distl_docstring(normal)
-add_distl_docstring(histogram_from_bins)
-add_distl_docstring(histogram_from_data)
-add_distl_docstring(mvgaussian)
-add_distl_docstring(mvhistogram_from_data)
-add_distl_docstring(uniform_around)
-add_distl_docstring(gaussian_around)
+add_dependency_docstrings((uniform, boxcar, gaussian, normal,  # delta,
+                           histogram_from_bins, histogram_from_data,
+                           mvgaussian, mvhistogram_from_data,
+                           uniform_around, gaussian_around),
+                          """This is an included dependency from [distl](https://distl.readthedocs.io).\n\n===============================================================\n\n""")
 
 
 # expose available "kinds" per-context
@@ -1094,5 +1126,36 @@ del MPI
 
 del re
 del strip_docstring_refs
-del add_nparray_docstring
-del add_distl_docstring
+del add_dependency_docstrings
+
+# the public top-level API (used by "from phoebe import *").  Subpackages that
+# only end up in the namespace as a side-effect of the imports above (backend,
+# frontend, parameters, utils, etc) are intentionally not included.
+__all__ = ('u', 'c',
+           'array', 'linspace', 'arange', 'logspace', 'geomspace', 'invspace',
+           'gaussian', 'gaussian_around', 'normal', 'boxcar', 'uniform', 'uniform_around',
+           'histogram_from_bins', 'histogram_from_data', 'mvgaussian', 'mvhistogram_from_data',
+           'install_passband', 'uninstall_passband', 'uninstall_all_passbands',
+           'download_passband', 'list_passband_online_history', 'update_passband_available',
+           'update_passband', 'update_all_passbands', 'list_all_update_passbands_available',
+           'list_online_passbands', 'list_installed_passbands', 'list_passbands',
+           'list_passband_directories', 'get_passband',
+           'hierarchy', 'component', 'compute', 'constraint', 'dataset', 'feature',
+           'figure', 'solver', 'server',
+           'dynamics', 'distortions', 'algorithms', 'libphoebe',
+           'Bundle', 'open', 'load', 'from_legacy', 'from_server',
+           'default_star', 'default_binary', 'default_contact_binary', 'default_triple',
+           'logger', 'conf', 'mpi', 'mpi_on', 'mpi_off', 'reset_settings',
+           'interactive_on', 'interactive_off',
+           'interactive_constraints_on', 'interactive_constraints_off',
+           'interactive_checks_on', 'interactive_checks_off',
+           'devel_on', 'devel_off',
+           'set_download_passband_defaults', 'get_download_passband_defaults',
+           'update_passband_ignore_version_on', 'update_passband_ignore_version_off',
+           'multiprocessing_on', 'multiprocessing_off',
+           'multiprocessing_get_nprocs', 'multiprocessing_set_nprocs',
+           'progressbars_on', 'progressbars_off',
+           'list_available_components', 'list_available_features',
+           'list_available_datasets', 'list_available_computes',
+           'list_available_solvers', 'list_available_servers',
+           'list_available_figures')
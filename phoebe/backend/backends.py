@@ -11,7 +11,7 @@ from copy import deepcopy
 import itertools
 
 from phoebe.parameters import dataset as _dataset
-from phoebe.parameters import StringParameter, DictParameter, ArrayParameter, ParameterSet
+from phoebe.parameters import StringParameter, DictParameter, ArrayParameter, FloatArrayParameter, ParameterSet
 from phoebe.parameters.parameters import _extract_index_from_string
 from phoebe import dynamics
 from phoebe.backend import universe, etvs, horizon_analytic
@@ -470,16 +470,63 @@ class BaseBackend(object):
         # TODO: move to BaseBackendByDataset or BaseBackend?
         logger.debug("rank:{}/{} {}._fill_syns".format(mpi.myrank, mpi.nprocs, self.__class__.__name__))
 
+        def _set_packet(packet):
+            try:
+                new_syns.set_value(check_visible=False, check_default=False, ignore_readonly=True, **packet)
+            except Exception as err:
+                raise ValueError("failed to set value from packet: {}.  Original error: {}".format(packet, str(err)))
+
+        # scalar values at a single time (fluxes, rvs, etc) each fill a single
+        # index of an array parameter.  Setting these one at a time would copy
+        # and re-validate the entire array for every time, so instead we
+        # collect them here and set each array parameter once below.
+        index_packets = {}
+
         for packetlists in rpacketlists_per_worker:
             # single worker
             for packetlist in packetlists:
                 # single time/dataset
                 for packet in packetlist:
                     # single parameter
-                    try:
-                        new_syns.set_value(check_visible=False, check_default=False, ignore_readonly=True, **packet)
-                    except Exception as err:
-                        raise ValueError("failed to set value from packet: {}.  Original error: {}".format(packet, str(err)))
+                    if packet.get('time', None) is not None and np.ndim(packet['value']) == 0:
+                        key = (packet['dataset'], packet['component'], packet['kind'], packet['qualifier'])
+                        index_packets.setdefault(key, []).append(packet)
+                    else:
+                        _set_packet(packet)
+
+        for (dataset, component, kind, qualifier), packets in index_packets.items():
+            filter_kwargs = {'dataset': dataset, 'component': component, 'kind': kind,
+                             'check_visible': False, 'check_default': False}
+
+            params = new_syns.filter(qualifier=qualifier, **filter_kwargs).to_list()
+            times_ps = new_syns.filter(qualifier='times', **filter_kwargs)
+            if len(params) != 1 or not isinstance(params[0], FloatArrayParameter) or params[0].time is not None or len(times_ps) != 1:
+                # then fallback on setting each packet individually
+                for packet in packets:
+                    _set_packet(packet)
+                continue
+
+            param = params[0]
+            syn_times = times_ps.get_value()
+            # get_value already returns a copy, so we can fill it directly
+            values = np.asarray(param.get_value(), dtype=float)
+
+            packet_times = np.array([packet['time'] for packet in packets])
+            packet_values = np.array([packet['value'].to(param.default_unit).value if isinstance(packet['value'], u.Quantity) else float(packet['value']) for packet in packets])
+
+            # a time may be repeated within the dataset, in which case every
+            # index at that time is filled from the same packet
+            sort = np.argsort(syn_times, kind='stable')
+            left = np.searchsorted(syn_times, packet_times, side='left', sorter=sort)
+            right = np.searchsorted(syn_times, packet_times, side='right', sorter=sort)
+            counts = right - left
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            values[sort[np.repeat(left, counts) + offsets]] = np.repeat(packet_values, counts)
+
+            try:
+                param.set_value(values, ignore_readonly=True)
+            except Exception as err:
+                raise ValueError("failed to set values for {}@{}@{}.  Original error: {}".format(qualifier, component, dataset, str(err)))
 
         return new_syns
 
@@ -504,7 +551,7 @@ class BaseBackend(object):
         if mpi.enabled:
             # broadcast the packet to ALL workers
             logger.debug("rank:{}/{} broadcasting to all workers".format(mpi.myrank, mpi.nprocs))
-            mpi.comm.bcast(packet, root=0)
+            mpi.bcast(packet)
 
             # now even the master can become a worker and take on a chunk
             packet['b'] = b
@@ -1056,6 +1103,30 @@ class PhoebeBackend(BaseBackendByTime):
             for i,t in enumerate(times):
                 zs[0][i] = vgamma*(t-t0)
 
+        # options for each dataset which are needed at every time, but do not
+        # themselves depend on time, so we only need to access them once
+        lp_options = {}
+        rv_offsets = {}
+        for infolist in infolists:
+            for info in infolist:
+                key = (info['dataset'], info['component'])
+                if info['kind'] == 'lp' and key not in lp_options.keys():
+                    if info['component'] in starrefs:
+                        lp_components = info['component']
+                    elif info['component'] in hier.get_orbits():
+                        lp_components = hier.get_stars_of_children_of(info['component'])
+                    else:
+                        raise NotImplementedError
+
+                    lp_options[key] = {'components': lp_components,
+                                       'profile_func': b.get_value(qualifier='profile_func', dataset=info['dataset'], context='dataset'),
+                                       'profile_rest': b.get_value(qualifier='profile_rest', dataset=info['dataset'], context='dataset'),
+                                       'profile_sv': b.get_value(qualifier='profile_sv', dataset=info['dataset'], context='dataset'),  # UNITS???
+                                       'wavelengths': b.get_value(qualifier='wavelengths', component=info['component'], dataset=info['dataset'], context='dataset', unit=u.nm)}
+
+                elif info['kind'] == 'rv' and info['needs_mesh'] and key not in rv_offsets.keys():
+                    rv_offsets[key] = b.get_value(qualifier='rv_offset', component=info['component'], dataset=info['dataset'], context='dataset', unit=u.solRad/u.d, **_skip_filter_checks)
+
         return dict(system=system,
                     hier=hier,
                     meshablerefs=meshablerefs,
@@ -1063,7 +1134,8 @@ class PhoebeBackend(BaseBackendByTime):
                     dynamics_method=dynamics_method,
                     ts=ts, xs=xs, ys=ys, zs=zs,
                     vxs=vxs, vys=vys, vzs=vzs,
-                    ethetas=ethetas, elongans=elongans, eincls=eincls)
+                    ethetas=ethetas, elongans=elongans, eincls=eincls,
+                    lp_options=lp_options, rv_offsets=rv_offsets)
 
     def _run_single_time(self, b, i, time, infolist, **kwargs):
         logger.debug("rank:{}/{} PhoebeBackend._run_single_time(i={}, time={}, infolist={}, **kwargs.keys={})".format(mpi.myrank, mpi.nprocs, i, time, infolist, kwargs.keys()))
@@ -1083,6 +1155,8 @@ class PhoebeBackend(BaseBackendByTime):
         ethetas = kwargs.get('ethetas')
         elongans = kwargs.get('elongans')
         eincls = kwargs.get('eincls')
+        lp_options = kwargs.get('lp_options')
+        rv_offsets = kwargs.get('rv_offsets')
 
         # Check to see what we might need to do that requires a mesh
         # TODO: make sure to use the requested distortion_method
@@ -1164,37 +1238,15 @@ class PhoebeBackend(BaseBackendByTime):
 
             # now check the kind to see what we need to fill
             if kind=='lp':
-                profile_func = b.get_value(qualifier='profile_func',
-                                           dataset=info['dataset'],
-                                           context='dataset')
-
-                profile_rest = b.get_value(qualifier='profile_rest',
-                                           dataset=info['dataset'],
-                                           context='dataset')
-
-                profile_sv = b.get_value(qualifier='profile_sv',
-                                         dataset=info['dataset'],
-                                         context='dataset')  # UNITS???
-
-                wavelengths = b.get_value(qualifier='wavelengths',
-                                          component=info['component'],
-                                          dataset=info['dataset'],
-                                          context='dataset',
-                                          unit=u.nm)
-
-                if info['component'] in b.hierarchy.get_stars():
-                    lp_components = info['component']
-                elif info['component'] in b.hierarchy.get_orbits():
-                    lp_components = b.hierarchy.get_stars_of_children_of(info['component'])
-                else:
-                    raise NotImplementedError
+                lp_opts = lp_options[(info['dataset'], info['component'])]
+                wavelengths = lp_opts['wavelengths']
 
                 obs = system.observe(info['dataset'],
                                      kind=kind,
-                                     components=lp_components,
-                                     profile_func=profile_func,
-                                     profile_rest=profile_rest,
-                                     profile_sv=profile_sv,
+                                     components=lp_opts['components'],
+                                     profile_func=lp_opts['profile_func'],
+                                     profile_rest=lp_opts['profile_rest'],
+                                     profile_sv=lp_opts['profile_sv'],
                                      wavelengths=wavelengths)
 
                 # TODO: copy the original for wavelengths just like we do with
@@ -1213,12 +1265,7 @@ class PhoebeBackend(BaseBackendByTime):
                                          kind=kind,
                                          components=info['component'])
 
-                    rv = obs['rv'] + b.get_value(qualifier='rv_offset',
-                                                 component=info['component'],
-                                                 dataset=info['dataset'],
-                                                 context='dataset',
-                                                unit=u.solRad/u.d,
-                                                 **_skip_filter_checks)
+                    rv = obs['rv'] + rv_offsets[(info['dataset'], info['component'])]
                 else:
                     # then rv_method == 'dynamical'
                     rv = -1*vzi[cind]
@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.optimize import newton
-from scipy.special import sph_harm as Y
-from math import sqrt, sin, cos, acos, atan2, trunc, pi
+from scipy.special import lpmv
+from math import sqrt, sin, cos, acos, atan2, trunc, pi, factorial
 import sys, os
 import copy
 
@@ -559,11 +559,18 @@ class System(object):
             dls = profile_rest*rvs/c.c.si.value
 
             line = func(sv(internal_wavelengths, profile_rest, profile_sv))
-            lines = np.array([np.interp(wavelengths, internal_wavelengths+dl, line) for dl in dls])
             if not np.any(visibilities):
                 avg_line = np.full_like(wavelengths, np.nan)
             else:
-                avg_line = np.average(lines, axis=0, weights=abs_intensities*areas*mus*visibilities)
+                weights = abs_intensities*areas*mus*visibilities
+                # only elements with non-zero weight contribute to the average,
+                # so we only need to shift the line for those.  Interpolating
+                # the line shifted by dl at wavelengths is the same as
+                # interpolating the rest-frame line at wavelengths-dl, which
+                # can be done for all elements in a single call.
+                contributing = weights != 0
+                lines = np.interp(wavelengths[None,:] - dls[contributing,None], internal_wavelengths, line)
+                avg_line = np.dot(weights[contributing], lines) / weights[contributing].sum()
 
             return {'flux_densities': avg_line}
 
@@ -972,6 +979,12 @@ class Body(object):
                 # TODO: eventually pass etheta to save_as_standard_mesh
                 protomesh = mesh.ProtoMesh(**new_mesh_dict)
                 self.save_as_standard_mesh(protomesh)
+                # the standard mesh is built from these same elements, so
+                # identify the mesh by the standard mesh (see below)
+                standard_mesh = self._standard_meshes[0.0]
+            else:
+                # this mesh is only used at this time
+                standard_mesh = new_mesh_dict
 
             # Here we'll build a scaledprotomesh directly from the newly
             # marched mesh
@@ -992,6 +1005,7 @@ class Body(object):
 
             # TODO: eventually pass etheta to get_standard_mesh
             scaledprotomesh = self.get_standard_mesh(scaled=True)
+            standard_mesh = self._standard_meshes[0.0]
             # TODO: can we avoid an extra copy here?
 
 
@@ -1002,6 +1016,11 @@ class Body(object):
             # intensities, etc.  Note that these WILL NOT affect the
             # coords_for_observations automatically - those should probably be
             # perturbed as well, unless there is a good reason not to.
+            for feature in self.features:
+                # before any feature displaces the coordinates, let each
+                # feature know which (undisplaced) mesh is in use
+                feature.process_standard_mesh(standard_mesh, scaledprotomesh.coords_for_computations)
+
             for feature in self.features:
                 # NOTE: these are ALWAYS done on the protomesh
                 coords_for_observations = feature.process_coords_for_computations(scaledprotomesh.coords_for_computations, s=self.polar_direction_xyz, t=self.time)
@@ -2003,7 +2022,10 @@ class Star_roche(Star):
     def needs_recompute_instantaneous(self):
         # recompute instantaneous for asynchronous spots, even if meshing
         # doesn't need to be recomputed
-        return self.needs_remesh or (len(self.features) and self.F != 1.0)
+        if self.needs_remesh or (len(self.features) and self.F != 1.0):
+            return True
+
+        return np.any([feature._recompute_instantaneous_required for feature in self.features])
 
     @property
     def needs_remesh(self):
@@ -2432,7 +2454,10 @@ class Star_rotstar(Star):
     def needs_recompute_instantaneous(self):
         # recompute instantaneous for asynchronous spots, even if meshing
         # doesn't need to be recomputed
-        return self.needs_remesh or (not self.is_single and len(self.features) and self.F != 1)
+        if self.needs_remesh or (not self.is_single and len(self.features) and self.F != 1):
+            return True
+
+        return np.any([feature._recompute_instantaneous_required for feature in self.features])
 
     @property
     def needs_remesh(self):
@@ -3037,7 +3062,10 @@ class Feature(object):
     kind of change it exacts to the mesh. For example, pulsations will require
     recomputing a mesh while spots will not. By default, the mesh will be
     recomputed (set in this superclass' `__init__()` method) but inherited
-    classes should overload `self._remeshing_required`.
+    classes should overload `self._remeshing_required`.  Features that only
+    displace the existing mesh can instead return False there and True for
+    `self._recompute_instantaneous_required`, in which case the standard mesh
+    is reused but local quantities are still recomputed at each time.
     """
     def __init__(self, *args, **kwargs):
         pass
@@ -3046,6 +3074,10 @@ class Feature(object):
     def _remeshing_required(self):
         return True
 
+    @property
+    def _recompute_instantaneous_required(self):
+        return self._remeshing_required
+
     @property
     def proto_coords(self):
         """
@@ -3056,6 +3088,18 @@ class Feature(object):
         """
         return False
 
+    def process_standard_mesh(self, standard_mesh, coords_for_computations):
+        """
+        Method for a feature to prepare anything that only depends on the
+        mesh, called at each time before any feature processes the
+        coordinates.  standard_mesh is the same object for as long as the
+        mesh itself does not change and coords_for_computations are the
+        undisplaced (scaled) coordinates of that mesh.
+
+        Features that cache quantities on the mesh should override this method.
+        """
+        return
+
     def process_coords_for_computations(self, coords_for_computations, s, t):
         """
         Method for a feature to process the coordinates.  Coordinates are
@@ -3210,12 +3254,37 @@ class Pulsation(Feature):
     def __init__(self, radamp, freq, l=0, m=0, tanamp=0.0, teffext=False, **kwargs):
         self._freq = freq
         self._radamp = radamp
-        self._l = l
-        self._m = m
+        self._l = int(l)
+        self._m = int(m)
         self._tanamp = tanamp
 
         self._teffext = teffext
 
+        # normalization of Y_lm does not depend on the position on the
+        # surface, so we only need to compute it once
+        if abs(self._m) > self._l:
+            self._Ylm_norm = 0.0
+        else:
+            self._Ylm_norm = sqrt((2*self._l+1)/(4*pi) * factorial(self._l-self._m)/factorial(self._l+self._m))
+
+        # sectoral modes (including radial, l=m=0) have a closed form for the
+        # associated Legendre function:
+        #   P_l^l = (-1)^l (2l-1)!! sin^l(theta)
+        #   P_l^-l = sin^l(theta) / (2l)!!
+        # so we store the coefficient here and can skip lpmv entirely
+        if abs(self._m) == self._l:
+            if self._m >= 0:
+                self._Plm_sectoral = (-1)**self._l * float(np.prod(np.arange(2*self._l-1, 0, -2)))
+            else:
+                self._Plm_sectoral = 1./float(np.prod(np.arange(2*self._l, 0, -2)))
+        else:
+            self._Plm_sectoral = None
+
+        # time-independent part of the mode, evaluated on the current mesh,
+        # and the mesh it was evaluated for.  See process_standard_mesh.
+        self._basis = None
+        self._basis_mesh = None
+
     @classmethod
     def from_bundle(cls, b, feature):
         """
@@ -3236,47 +3305,107 @@ class Pulsation(Feature):
 
         return cls(radamp, freq, l, m, tanamp, teffext)
 
+    @property
+    def _remeshing_required(self):
+        # the displacements are always applied to the coordinates of the
+        # standard (undisplaced) mesh, so the star itself does not need to be
+        # re-meshed, but areas, normals and all local quantities do need to
+        # be recomputed at each time
+        return False
+
+    @property
+    def _recompute_instantaneous_required(self):
+        return True
+
     @property
     def proto_coords(self):
         """
         """
         return True
 
-    def dYdtheta(self, m, l, theta, phi):
-        if abs(m) > l:
-            return 0
+    def spherical_harmonics(self, theta, phi):
+        """
+        Evaluate Y_lm at all elements in a single vectorized pass.
 
-        # TODO: just a quick hack
-        if abs(m+1) > l:
-            last_term = 0.0
-        else:
-            last_term = Y(m+1, l, theta, phi)
+        :parameter array theta: colatitude of each element wrt the z-axis [rad]
+        :parameter array phi: longitude of each element [rad]
+        :return: complex array of Y_lm
+        """
+        l, m = self._l, self._m
 
-        return m/np.tan(theta)*Y(m, l, theta, phi) + np.sqrt((l-m)*(l+m+1))*np.exp(-1j*phi)*last_term
+        emphi = self._Ylm_norm * np.exp(1j*m*phi)
 
-    def dYdphi(self, m, l, theta, phi):
-        return 1j*m*Y(m, l, theta, phi)
+        if self._Plm_sectoral is not None:
+            # |m| == l: P_lm = C sin^l(theta)
+            if l == 0:
+                return np.full_like(theta, self._Plm_sectoral) * emphi
 
-    def process_coords_for_computations(self, coords_for_computations, s, t):
+            return self._Plm_sectoral * np.sin(theta)**l * emphi
+
+        return lpmv(m, l, np.cos(theta)) * emphi
+
+    def _prepare_basis(self, coords):
         """
+        Evaluate everything about the mode that does not depend on time at
+        the given coordinates.
         """
-        if self._teffext:
-            return coords_for_computations
-
-        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt((coords_for_computations**2).sum(axis=1))
+        x, y, z, r = coords[:,0], coords[:,1], coords[:,2], np.sqrt((coords**2).sum(axis=1))
         theta = np.arccos(z/r)
         phi = np.arctan2(y, x)
 
-        xi_r = self._radamp * Y(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
-        xi_t = self._tanamp * self.dYdtheta(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
-        xi_p = self._tanamp/np.sin(theta) * self.dYdphi(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
+        Y = self.spherical_harmonics(theta, phi)
+
+        # radial unit vector: (sin(theta)cos(phi), sin(theta)sin(phi), cos(theta))
+        rhat = coords / r[:,None]
+
+        return {'rhat': rhat,
+                'Y': Y,
+                # real and imaginary parts of Y_lm along rhat so that the
+                # displacement at any time is a real linear combination of
+                # the two (see _radial_displacement)
+                'Y_rhat_real': Y.real[:,None] * rhat,
+                'Y_rhat_imag': Y.imag[:,None] * rhat}
+
+    def process_standard_mesh(self, standard_mesh, coords_for_computations):
+        """
+        Re-evaluate the basis only when the mesh changes.  The basis only
+        depends on the direction of each element, so it is evaluated on the
+        undisplaced coordinates and is then valid for the coordinates
+        displaced by this (or any other) pulsation.
+        """
+        if self._basis is None or standard_mesh is not self._basis_mesh:
+            logger.debug("pulsation: evaluating Y_lm basis for l={} m={} on {} elements".format(self._l, self._m, len(coords_for_computations)))
+            self._basis = self._prepare_basis(coords_for_computations)
+            # keep a reference so that the identity check above stays valid
+            self._basis_mesh = standard_mesh
+
+    def _radial_displacement(self, coords, t):
+        """
+        Apply the temporal phase to the (cached) basis.  Only the radial
+        displacement is currently applied to the mesh.
+        """
+        if self._basis is None:
+            # process_standard_mesh was never called, so use these coordinates
+            self.process_standard_mesh(None, coords)
+        basis = self._basis
 
-        new_coords = np.zeros(coords_for_computations.shape)
-        new_coords[:,0] = coords_for_computations[:,0] + xi_r * np.sin(theta) * np.cos(phi)
-        new_coords[:,1] = coords_for_computations[:,1] + xi_r * np.sin(theta) * np.sin(phi)
-        new_coords[:,2] = coords_for_computations[:,2] + xi_r * np.cos(theta)
+        # the time-dependence only enters through a single complex scalar, so
+        # Re(amp * Y_lm) * rhat = Re(amp) Re(Y_lm) rhat - Im(amp) Im(Y_lm) rhat
+        # avoids any complex arithmetic over the mesh
+        amp = self._radamp * np.exp(-1j*2*np.pi*self._freq*t)
 
-        return new_coords
+        displacement = np.multiply(basis['Y_rhat_real'], amp.real)
+        displacement -= amp.imag * basis['Y_rhat_imag']
+
+        return displacement
+
+    def process_coords_for_computations(self, coords_for_computations, s, t):
+        """
+        """
+        if self._teffext:
+            return coords_for_computations
+
+        return coords_for_computations + self._radial_displacement(coords_for_computations, t)
 
     def process_coords_for_observations(self, coords_for_computations, coords_for_observations, s, t):
         """
@@ -3294,20 +3423,7 @@ class Pulsation(Feature):
         # if not self._teffext:
             # return coords_for_observations
 
-        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt((coords_for_computations**2).sum(axis=1))
-        theta = np.arccos(z/r)
-        phi = np.arctan2(y, x)
-
-        xi_r = self._radamp * Y(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
-        xi_t = self._tanamp * self.dYdtheta(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
-        xi_p = self._tanamp/np.sin(theta) * self.dYdphi(self._m, self._l, theta, phi) * np.exp(-1j*2*np.pi*self._freq*t)
-
-        new_coords = np.zeros(coords_for_observations.shape)
-        new_coords[:,0] = coords_for_observations[:,0] + xi_r * np.sin(theta) * np.cos(phi)
-        new_coords[:,1] = coords_for_observations[:,1] + xi_r * np.sin(theta) * np.sin(phi)
-        new_coords[:,2] = coords_for_observations[:,2] + xi_r * np.cos(theta)
-
-        return new_coords
+        return coords_for_observations + self._radial_displacement(coords_for_computations, t)
 
     def process_teffs(self, teffs, coords, s=np.array([0., 0., 1.]), t=None):
         """
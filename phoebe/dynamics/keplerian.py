@@ -403,7 +403,59 @@ def dynamics(times, periods, eccs, smas, t0_perpasses, per0s, long_ans, incls,
 
 
 
-def _true_anomaly(M,ecc,itermax=8):
+def _solve_kepler_markley(M,ecc):
+    r"""
+    Non-iterative solution of Kepler's equation :math:`E - e\sin E = M`.
+
+    Uses the cubic starter of Markley (1995, Celest. Mech. 63, 101) followed by
+    a single fifth-order correction and one Newton step, which gives the
+    eccentric anomaly to near machine (relative) precision for all
+    eccentricities (0 <= e < 1), including as M approaches 0, without any
+    convergence checks.
+
+    @parameter M: mean anomaly
+    @type M: float or array
+    @parameter ecc: eccentricity
+    @type ecc: float or array
+    @return: eccentric anomaly (E), continuous in M
+    @rtype: float or array
+    """
+    # reduce to [-pi, pi] and use the symmetry E(-M) = -E(M).  Subtracting
+    # whole revolutions (rather than taking mod(M+pi, 2pi)-pi) leaves M
+    # untouched within the first revolution, so that small |M| keeps its
+    # relative precision.
+    M_red = M - 2*pi*np.round(M/(2*pi))
+    M_abs = np.abs(M_red)
+
+    # Markley's starter (equations 20 - 21)
+    ome = 1. - ecc
+    M2 = M_abs*M_abs
+    alpha = (3*pi**2 + 1.6*pi*(pi-M_abs)/(1+ecc)) / (pi**2 - 6)
+    d = 3*ome + alpha*ecc
+    alphad = alpha*d
+    r = (3*alphad*(d-ome) + M2)*M_abs
+    q = 2*alphad*ome - M2
+    q2 = q*q
+    w = np.cbrt(np.abs(r) + sqrt(q2*q + r*r))**2
+    E = (2*r*w/(w*w + w*q + q2) + M_abs) / d
+
+    # fifth-order correction (equations 28 - 29)
+    f2 = ecc*sin(E)
+    f0 = E - f2 - M_abs
+    f3 = ecc*cos(E)
+    f1 = 1. - f3
+    d3 = -f0/(f1 - 0.5*f0*f2/f1)
+    d4 = -f0/(f1 + 0.5*d3*f2 + d3*d3*f3/6.)
+    E += -f0/(f1 + 0.5*d4*f2 + d4*d4*f3/6. - d4*d4*d4*f2/24.)
+
+    # final Newton step.  The residual is written as (1-e)E - e(sinE - E) - M
+    # so that it does not cancel for small E, where E ~ M/(1-e).
+    E -= (ome*E - ecc*(sin(E) - E) - M_abs)/(1. - ecc*cos(E))
+
+    # restore the sign and the number of revolutions
+    return np.copysign(E, M_red) + (M - M_red)
+
+def _true_anomaly(M,ecc):
     r"""
     Calculation of true and eccentric anomaly in Kepler orbits.
 
@@ -427,31 +479,20 @@ def _true_anomaly(M,ecc,itermax=8):
 
         \tan(\theta/2) = \sqrt{\frac{1+e}{1-e}} \tan(E/2)
 
+    Kepler's equation is solved with :func:`_solve_kepler_markley`.
+
     @parameter M: phase
     @type M: float
     @parameter ecc: eccentricity
     @type ecc: float
-    @keyword itermax: maximum number of iterations
-    @type itermax: integer
     @return: eccentric anomaly (E), true anomaly (theta)
     @rtype: float,float
     """
-    # Initial value
-    Fn = M + ecc*sin(M) + ecc**2/2.*sin(2*M)
-
-    # Iterative solving of the transcendent Kepler's equation
-    for i in range(itermax):
-        F = Fn
-        Mn = F-ecc*sin(F)
-        Fn = F+(M-Mn)/(1.-ecc*cos(F))
-        keep = F!=0 # take care of zerodivision
-        if hasattr(F,'__iter__'):
-            if np.all(abs((Fn-F)[keep]/F[keep])<0.00001):
-                break
-        elif (abs((Fn-F)/F)<0.00001):
-            break
-
-    # relationship between true anomaly (theta) and eccentric anomaly (Fn)
-    true_an = 2.*arctan(sqrt((1.+ecc)/(1.-ecc))*tan(Fn/2.))
+    Fn = _solve_kepler_markley(M,ecc)
+
+    # relationship between true anomaly (theta) and eccentric anomaly (Fn).
+    # This is equivalent to the half-angle tangent relation above (and also
+    # returns theta in (-pi, pi]) but avoids the singularity of tan at Fn=pi.
+    true_an = np.arctan2(sqrt(1.-ecc**2)*sin(Fn), cos(Fn)-ecc)
 
     return Fn,true_an
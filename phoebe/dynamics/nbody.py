@@ -2,7 +2,6 @@
 """
 
 import numpy as np
-from scipy.optimize import newton
 
 
 from phoebe import u, c
@@ -34,6 +33,10 @@ logger.addHandler(logging.NullHandler())
 
 _skip_filter_checks = {'check_default': False, 'check_visible': False}
 
+_c_AU_d = c.c.to(u.AU/u.d).value
+_au_to_solrad = (1*u.AU).to(u.solRad).value
+_G_AU3_Msun_d2 = c.G.to('AU3 / (Msun d2)').value
+
 def _ensure_tuple(item):
     """
     Simply ensure that the passed item is a tuple.  If it is not, then
@@ -97,6 +100,8 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
 
     starrefs = hier.get_stars()
     orbitrefs = hier.get_orbits() if use_kepcart else [hier.get_parent_of(star) for star in starrefs]
+    # all of the component lookups below are from this small subset
+    compps = b.filter(context='component', component=starrefs+orbitrefs, **_skip_filter_checks)
 
     def mean_anom(t0, t0_perpass, period):
         # TODO: somehow make this into a constraint where t0 and mean anom
@@ -104,18 +109,18 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
         # (one is constrained from the other and the orbit.... nvm, this gets ugly)
         return 2 * np.pi * (t0 - t0_perpass) / period
 
-    masses = [b.get_value(qualifier='mass', unit=u.solMass, component=component, context='component', **_skip_filter_checks) * c.G.to('AU3 / (Msun d2)').value for component in starrefs]  # GM
-    smas = [b.get_value(qualifier='sma', unit=u.AU, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    eccs = [b.get_value(qualifier='ecc', component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    incls = [b.get_value(qualifier='incl', unit=u.rad, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    per0s = [b.get_value(qualifier='per0', unit=u.rad, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    long_ans = [b.get_value(qualifier='long_an', unit=u.rad, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    t0_perpasses = [b.get_value(qualifier='t0_perpass', unit=u.d, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
-    periods = [b.get_value(qualifier='period', unit=u.d, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
+    masses = [compps.get_value(qualifier='mass', unit=u.solMass, component=component, **_skip_filter_checks) * _G_AU3_Msun_d2 for component in starrefs]  # GM
+    smas = [compps.get_value(qualifier='sma', unit=u.AU, component=component, **_skip_filter_checks) for component in orbitrefs]
+    eccs = [compps.get_value(qualifier='ecc', component=component, **_skip_filter_checks) for component in orbitrefs]
+    incls = [compps.get_value(qualifier='incl', unit=u.rad, component=component, **_skip_filter_checks) for component in orbitrefs]
+    per0s = [compps.get_value(qualifier='per0', unit=u.rad, component=component, **_skip_filter_checks) for component in orbitrefs]
+    long_ans = [compps.get_value(qualifier='long_an', unit=u.rad, component=component, **_skip_filter_checks) for component in orbitrefs]
+    t0_perpasses = [compps.get_value(qualifier='t0_perpass', unit=u.d, component=component, **_skip_filter_checks) for component in orbitrefs]
+    periods = [compps.get_value(qualifier='period', unit=u.d, component=component, **_skip_filter_checks) for component in orbitrefs]
 
     if return_roche_euler:
         # rotperiods are only needed to compute instantaneous syncpars
-        rotperiods = [b.get_value(qualifier='period', unit=u.d, component=component, context='component', **_skip_filter_checks) for component in starrefs]
+        rotperiods = [compps.get_value(qualifier='period', unit=u.d, component=component, **_skip_filter_checks) for component in starrefs]
     else:
         rotperiods = None
 
@@ -123,13 +128,50 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
     t0 = b.get_value(qualifier='t0', context='system', unit=u.d, **_skip_filter_checks)
 
     # mean_anoms = [mean_anom(t0, t0_perpass, period) for t0_perpass, period in zip(t0_perpasses, periods)]
-    mean_anoms = [b.get_value(qualifier='mean_anom', unit=u.rad, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
+    mean_anoms = [compps.get_value(qualifier='mean_anom', unit=u.rad, component=component, **_skip_filter_checks) for component in orbitrefs]
 
     return dynamics(times, masses, smas, eccs, incls, per0s, long_ans, \
                     mean_anoms, rotperiods, t0, vgamma, stepsize, ltte, gr,
                     integrator, use_kepcart=use_kepcart, return_roche_euler=return_roche_euler)
 
 
+def _auto_integrator(masses, smas, eccs, stepsize, ltte=False, gr=False):
+    """
+    Choose the rebound integrator (and stepsize) for integrator='auto'.
+
+    Without GR, light travel time effects or highly eccentric orbits, the
+    fixed-step symplectic WHFast integrator is much faster than IAS15 at
+    comparable accuracy as long as we take ~20 steps per (shortest) orbital
+    period.  Otherwise IAS15 is used with the provided stepsize.
+
+    Args:
+        masses: (iterable) GM for each particle
+        smas: (iterable) semi-major axis for each particle (the first entry
+            is ignored) or for each orbit [AU]
+        eccs: (iterable) eccentricities, in the same layout as smas
+        stepsize: (float) stepsize to use for IAS15
+        ltte: (bool, default False) whether light travel time effects are
+            included
+        gr: (bool, default False) whether general relativity effects are
+            included
+
+    Returns:
+        integrator, stepsize
+    """
+    masses = np.asarray(masses, dtype=float)
+    smas = np.asarray(smas, dtype=float)
+    eccs = np.asarray(eccs, dtype=float)
+
+    # particle j (j >= 1) orbits the center of mass of all previous
+    # particles, so its period follows from the cumulative mass.
+    orbit_inds = np.arange(1, len(masses)) - (len(masses) - len(smas))
+
+    if not len(orbit_inds) or ltte or gr or np.max(eccs[orbit_inds]) >= 0.5:
+        return 'ias15', stepsize
+
+    periods = 2*np.pi*np.sqrt(smas[orbit_inds]**3 / np.cumsum(masses)[1:])
+    return 'whfast', np.min(periods) / 20.
+
 def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
         rotperiods=None, t0=0.0, vgamma=0.0, stepsize=0.01, ltte=False, gr=False,
         integrator='ias15', return_roche_euler=False, use_kepcart=False):
@@ -140,23 +182,21 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
     if gr and not _can_reboundx:
         raise ImportError("reboundx is not installed (required for gr effects)")
 
-    def particle_ltte(sim, particle_N, t_obs):
-        c_AU_d = c.c.to(u.AU/u.d).value
-
-        def residual(t):
-            # print "*** ltte trying t:", t
+    def particle_ltte(sim, particle_N, t_obs, itermax=10, tol=1e-12):
+        # we need t such that t - z(t)/c = t_obs.  Since |vz| << c, the
+        # fixed-point iteration t -> t_obs + z(t)/c converges within a couple
+        # of steps, each of which costs only a single integration.
+        t = t_obs
+        for i in range(itermax):
             if sim.t != t:
                 sim.integrate(t, exact_finish_time=True)
-            ltte_dt = sim.particles[particle_N].z / c_AU_d
-            t_barycenter = t - ltte_dt
-            # print "***** ", t_barycenter-t_obs
-
-            return t_barycenter - t_obs
-
-        t_barycenter = newton(residual, t_obs)
+            t_next = t_obs + sim.particles[particle_N].z / _c_AU_d
+            if abs(t_next - t) < tol:
+                break
+            t = t_next
 
-        if sim.t != t_barycenter:
-            sim.integrate(t_barycenter)
+        if sim.t != t:
+            sim.integrate(t, exact_finish_time=True)
 
         return sim.particles[particle_N]
 
@@ -172,6 +212,10 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
         # http://reboundx.readthedocs.io/en/latest/effects.html#general-relativity
         params = rebx.add_gr_full()
 
+    if integrator == 'auto':
+        integrator, stepsize = _auto_integrator(masses, smas, eccs, stepsize, ltte=ltte, gr=gr)
+        logger.info("integrator='auto' using {} in rebound".format(integrator))
+
     sim.integrator = integrator
     # NOTE: according to rebound docs: "stepsize will change for adaptive integrators such as IAS15"
     sim.dt = stepsize
@@ -235,23 +279,33 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
         # vgamma is in the direction of positive RV or negative vz
         particle.vz -= vgamma
 
-    xs = [np.zeros(times.shape) for m in masses]
-    ys = [np.zeros(times.shape) for m in masses]
-    zs = [np.zeros(times.shape) for m in masses]
-    vxs = [np.zeros(times.shape) for m in masses]
-    vys = [np.zeros(times.shape) for m in masses]
-    vzs = [np.zeros(times.shape) for m in masses]
+    # one (nstars, ntimes) array per quantity.  These are split back into
+    # a list of per-star arrays (as views) when returning.
+    shape = (len(masses), len(times))
+    xs = np.zeros(shape)
+    ys = np.zeros(shape)
+    zs = np.zeros(shape)
+    vxs = np.zeros(shape)
+    vys = np.zeros(shape)
+    vzs = np.zeros(shape)
 
     if return_roche_euler:
         # from instantaneous Keplerian dynamics for Roche meshing
-        ds = [np.zeros(times.shape) for m in masses]
-        Fs = [np.zeros(times.shape) for m in masses]
-
-        ethetas = [np.zeros(times.shape) for m in masses]
-        elongans = [np.zeros(times.shape) for m in masses]
-        eincls = [np.zeros(times.shape) for m in masses]
-
-    au_to_solrad = (1*u.AU).to(u.solRad).value
+        ds = np.zeros(shape)
+        Fs = np.zeros(shape)
+
+        ethetas = np.zeros(shape)
+        elongans = np.zeros(shape)
+        eincls = np.zeros(shape)
+
+    # without ltte all particles are read at the same time, so we can copy
+    # them out of the simulation in a single call per time.  Older versions
+    # of rebound do not provide serialize_particle_data, in which case we
+    # fall back on reading each particle separately.
+    serialize = not ltte and hasattr(sim, 'serialize_particle_data')
+    if serialize:
+        xyz = np.zeros((len(masses), 3))
+        vxvyvz = np.zeros((len(masses), 3))
 
     for i,time in enumerate(times):
 
@@ -261,24 +315,33 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
             # TODO: do we need to do this after handling LTTE???
             # orbits = sim.calculate_orbits()
 
+        # NOTE: x and y are flipped because of different coordinate system
+        # conventions.  If we change our coordinate system to have x point
+        # to the left, this will need to be updated to match as well.
+        if serialize:
+            sim.serialize_particle_data(xyz=xyz, vxvyvz=vxvyvz)
+            xs[:, i] = -1 * xyz[:, 0] * _au_to_solrad # solRad
+            ys[:, i] = -1 * xyz[:, 1] * _au_to_solrad # solRad
+            zs[:, i] = xyz[:, 2] * _au_to_solrad  # solRad
+            vxs[:, i] = -1 * vxvyvz[:, 0] * _au_to_solrad # solRad/d
+            vys[:, i] = -1 * vxvyvz[:, 1] * _au_to_solrad # solRad/d
+            vzs[:, i] = vxvyvz[:, 2] * _au_to_solrad # solRad/d
+
         for j in range(len(masses)):
 
-            if ltte:
-                # then we need to integrate to different times per object
-                particle = particle_ltte(sim, j, time)
-            else:
-                # print "***", time, j, sim.N
-                particle = sim.particles[j]
-
-            # NOTE: x and y are flipped because of different coordinate system
-            # conventions.  If we change our coordinate system to have x point
-            # to the left, this will need to be updated to match as well.
-            xs[j][i] = -1 * particle.x * au_to_solrad # solRad
-            ys[j][i] = -1 * particle.y * au_to_solrad # solRad
-            zs[j][i] = particle.z * au_to_solrad  # solRad
-            vxs[j][i] = -1 * particle.vx * au_to_solrad # solRad/d
-            vys[j][i] = -1 * particle.vy * au_to_solrad # solRad/d
-            vzs[j][i] = particle.vz * au_to_solrad # solRad/d
+            if not serialize:
+                if ltte:
+                    # then we need to integrate to different times per object
+                    particle = particle_ltte(sim, j, time)
+                else:
+                    particle = sim.particles[j]
+
+                xs[j, i] = -1 * particle.x * _au_to_solrad # solRad
+                ys[j, i] = -1 * particle.y * _au_to_solrad # solRad
+                zs[j, i] = particle.z * _au_to_solrad  # solRad
+                vxs[j, i] = -1 * particle.vx * _au_to_solrad # solRad/d
+                vys[j, i] = -1 * particle.vy * _au_to_solrad # solRad/d
+                vzs[j, i] = particle.vz * _au_to_solrad # solRad/d
 
             if return_roche_euler:
                 # TODO: do we want the LTTE-adjust particles?
@@ -296,27 +359,27 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
 
                 # for instantaneous separation, we need the current separation
                 # from the sibling component in units of its instantaneous (?) sma
-                ds[j][i] = orbit.d / orbit.a
+                ds[j, i] = orbit.d / orbit.a
                 # for syncpar (F), assume that the rotational FREQUENCY will
                 # remain fixed - so we simply need to updated syncpar based
                 # on the INSTANTANEOUS orbital PERIOD.
-                Fs[j][i] = orbit.P / rotperiods[j]
+                Fs[j, i] = orbit.P / rotperiods[j]
 
                 # TODO: need to add np.pi for secondary component
-                ethetas[j][i] = orbit.f + orbit.omega # true anomaly + periastron
+                ethetas[j, i] = orbit.f + orbit.omega # true anomaly + periastron
 
-                elongans[j][i] = orbit.Omega
+                elongans[j, i] = orbit.Omega
 
-                eincls[j][i] = orbit.inc
+                eincls[j, i] = orbit.inc
 
 
     if return_roche_euler:
         # d, solRad, solRad/d, rad, unitless (sma), unitless, rad, rad, rad
-        return times, xs, ys, zs, vxs, vys, vzs, ds, Fs, ethetas, elongans, eincls
+        return times, list(xs), list(ys), list(zs), list(vxs), list(vys), list(vzs), list(ds), list(Fs), list(ethetas), list(elongans), list(eincls)
 
     else:
         # d, solRad, solRad/d, rad
-        return times, xs, ys, zs, vxs, vys, vzs
+        return times, list(xs), list(ys), list(zs), list(vxs), list(vys), list(vzs)
 
 
 def dynamics_from_bundle_bs(b, times, compute=None, return_roche_euler=False, **kwargs):
@@ -355,6 +418,8 @@ def dynamics_from_bundle_bs(b, times, compute=None, return_roche_euler=False, **
 
     starrefs = hier.get_stars()
     orbitrefs = hier.get_orbits()
+    # all of the component lookups below are from this small subset
+    compps = b.filter(context='component', component=starrefs+orbitrefs, **_skip_filter_checks)
 
     def mean_anom(t0, t0_perpass, period):
         # TODO: somehow make this into a constraint where t0 and mean anom
@@ -362,20 +427,20 @@ def dynamics_from_bundle_bs(b, times, compute=None, return_roche_euler=False, **
         # (one is constrained from the other and the orbit.... nvm, this gets ugly)
         return 2 * np.pi * (t0 - t0_perpass) / period
 
-    masses = [b.get_value('mass', u.solMass, component=component, context='component') * c.G.to('AU3 / (Msun d2)').value for component in starrefs]  # GM
-    smas = [b.get_value('sma', u.AU, component=component, context='component') for component in orbitrefs]
-    eccs = [b.get_value('ecc', component=component, context='component') for component in orbitrefs]
-    incls = [b.get_value('incl', u.rad, component=component, context='component') for component in orbitrefs]
-    per0s = [b.get_value('per0', u.rad, component=component, context='component') for component in orbitrefs]
-    long_ans = [b.get_value('long_an', u.rad, component=component, context='component') for component in orbitrefs]
-    t0_perpasses = [b.get_value('t0_perpass', u.d, component=component, context='component') for component in orbitrefs]
-    periods = [b.get_value('period', u.d, component=component, context='component') for component in orbitrefs]
+    masses = [compps.get_value('mass', u.solMass, component=component) * _G_AU3_Msun_d2 for component in starrefs]  # GM
+    smas = [compps.get_value('sma', u.AU, component=component) for component in orbitrefs]
+    eccs = [compps.get_value('ecc', component=component) for component in orbitrefs]
+    incls = [compps.get_value('incl', u.rad, component=component) for component in orbitrefs]
+    per0s = [compps.get_value('per0', u.rad, component=component) for component in orbitrefs]
+    long_ans = [compps.get_value('long_an', u.rad, component=component) for component in orbitrefs]
+    t0_perpasses = [compps.get_value('t0_perpass', u.d, component=component) for component in orbitrefs]
+    periods = [compps.get_value('period', u.d, component=component) for component in orbitrefs]
 
     vgamma = b.get_value('vgamma', context='system', unit=u.solRad/u.d)
     t0 = b.get_value('t0', context='system', unit=u.d)
 
     # mean_anoms = [mean_anom(t0, t0_perpass, period) for t0_perpass, period in zip(t0_perpasses, periods)]
-    mean_anoms = [b.get_value('mean_anom', u.rad, component=component, context='component') for component in orbitrefs]
+    mean_anoms = [compps.get_value('mean_anom', u.rad, component=component) for component in orbitrefs]
 
     return dynamics_bs(times, masses, smas, eccs, incls, per0s, long_ans, \
                     mean_anoms, t0, vgamma, stepsize, orbiterror, ltte,
@@ -458,30 +523,37 @@ def dynamics_bs(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
     # TODO: need to return euler angles... if that even makes sense?? Or maybe we
     # need to make a new place in orbit??
 
-    au_to_solrad = (1*u.AU).to(u.solRad).value
+    def per_object(key):
+        # d[key] is indexed as [time][object], we want a row per object
+        values = np.asarray(d[key], dtype=float).reshape(ntimes, -1)
+        if values.shape[1] != nobjects:
+            raise ValueError("photodynam returned {} values per time for '{}', expected one for each of the {} objects".format(values.shape[1], key, nobjects))
+        return values.T
 
     ts = np.array(d['t'])
-    xs = [(-1*np.array([d['x'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-    ys = [(-1*np.array([d['y'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-    zs = [(np.array([d['z'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-    vxs = [(-1*np.array([d['vx'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-    vys = [(-1*np.array([d['vy'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-    vzs = [(np.array([d['vz'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
+    xs = list(-1*per_object('x')*_au_to_solrad)
+    ys = list(-1*per_object('y')*_au_to_solrad)
+    zs = list(per_object('z')*_au_to_solrad)
+    vxs = list(-1*per_object('vx')*_au_to_solrad)
+    vys = list(-1*per_object('vy')*_au_to_solrad)
+    vzs = list(per_object('vz')*_au_to_solrad)
 
     if return_roche_euler:
         # raise NotImplementedError("euler angles for BS not currently supported")
         # a (sma), e (ecc), in (incl), o (per0?), ln (long_an?), m (mean_anom?)
-        ds = [(np.array([d['kepl_a'][ti][oi] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
+        ds = list(per_object('kepl_a')*_au_to_solrad)
         # TODO: fix this
-        Fs = [(np.array([1.0 for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
+        Fs = [np.full(ntimes, 1.0*_au_to_solrad) for oi in range(nobjects)]
+        # the orbit of each object (the first two objects share the inner orbit)
+        orbit_inds = [0 if oi==0 else oi-1 for oi in range(nobjects)]
         # TODO: check to make sure this is the right angle
         # TODO: need to add np.pi for secondary component?
         # true anomaly + periastron
-        ethetas = [(np.array([d['kepl_o'][ti][oi]+d['kepl_m'][ti][oi]+np.pi/2 for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-        # elongans = [(np.array([d['kepl_ln'][ti][oi]+long_ans[0 if oi==0 else oi-1] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-        elongans = [(np.array([d['kepl_ln'][ti][oi]+long_ans[0 if oi==0 else oi-1] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-        # eincls = [(np.array([d['kepl_in'][ti][oi]+incls[0 if oi==0 else oi-1] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
-        eincls = [(np.array([d['kepl_in'][ti][oi]+np.pi-incls[0 if oi==0 else oi-1] for ti in range(ntimes)])*au_to_solrad) for oi in range(nobjects)]
+        ethetas = list((per_object('kepl_o')+per_object('kepl_m')+np.pi/2)*_au_to_solrad)
+        # elongans = list((per_object('kepl_ln')+np.asarray(long_ans)[orbit_inds, np.newaxis])*_au_to_solrad)
+        elongans = list((per_object('kepl_ln')+np.asarray(long_ans)[orbit_inds, np.newaxis])*_au_to_solrad)
+        # eincls = list((per_object('kepl_in')+np.asarray(incls)[orbit_inds, np.newaxis])*_au_to_solrad)
+        eincls = list((per_object('kepl_in')+np.pi-np.asarray(incls)[orbit_inds, np.newaxis])*_au_to_solrad)
 
 
 
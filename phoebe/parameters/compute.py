@@ -129,7 +129,7 @@ def phoebe(**kwargs):
         # note: even though bs isn't an option, its manually added as an option in test_dynamics and test_dynamics_grid
         params += [BoolParameter(visible_if='dynamics_method:bs', qualifier='gr', value=kwargs.get('gr', False), description='Whether to account for general relativity effects')]
         params += [FloatParameter(visible_if='dynamics_method:bs', qualifier='stepsize', value=kwargs.get('stepsize', 0.01), default_unit=None, description='stepsize for the N-body integrator')]         # TODO: improve description (and units??)
-        params += [ChoiceParameter(visible_if='dynamics_method:bs', qualifier='integrator', value=kwargs.get('integrator', 'ias15'), choices=['ias15', 'whfast', 'sei', 'leapfrog', 'hermes'], description='Which integrator to use within rebound')]
+        params += [ChoiceParameter(visible_if='dynamics_method:bs', qualifier='integrator', value=kwargs.get('integrator', 'ias15'), choices=['auto', 'ias15', 'whfast', 'sei', 'leapfrog', 'hermes'], description='Which integrator to use within rebound.  auto: whfast with ~20 steps per shortest orbital period (ignoring stepsize) if ltte and gr are False and all eccentricities are below 0.5, otherwise ias15.')]
 
 
     # PHYSICS
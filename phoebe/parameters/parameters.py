@@ -6010,14 +6010,14 @@ class ParameterSet(object):
                         times_attr += [float(t) for t in ps.times]
                     else:
                         for param in ps.filter(qualifier='times').to_list():
-                            times_computed += list(param.get_value())
+                            times_computed.append(param.get_value())
 
                 if len(times_attr):
                     logger.info("no times were providing, so defaulting to animate over all tagged times")
                     times = sorted(list(set(times_attr)))
                 else:
                     logger.info("no times were provided, so defaulting to animate over all computed times in the model")
-                    times = sorted(list(set(times_computed)))
+                    times = list(np.unique(np.concatenate(times_computed))) if len(times_computed) else []
 
             logger.info("calling autofig.animate(i={}, draw_sidebars={}, draw_title={}, tight_layout={}, interval={}, save={}, show={}, save_kwargs={})".format(times, draw_sidebars, draw_title, tight_layout, interval, save, show, save_kwargs))
 
@@ -10320,8 +10320,9 @@ class FloatArrayParameter(FloatParameter):
         if not (isinstance(other, list) or isinstance(other, np.ndarray)):
             return super(FloatArrayParameter, self).__add__(other)
 
-        # then we have a list, so we want to append to the existing value
-        return np.array([v for v in self.get_value() if v not in other])
+        # then we have a list, so we want to remove those entries from the existing value
+        value = self.get_value()
+        return value[~np.isin(value, other)]
 
     # def set_value_at_time(self, time, value, **kwargs):
     #     """
@@ -4,7 +4,6 @@ from phoebe import conf
 from phoebe import geomspace as _geomspace
 from phoebe import linspace as _linspace
 
-from distutils.version import StrictVersion
 import numpy as np
 
 
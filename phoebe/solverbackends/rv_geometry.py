@@ -5,8 +5,11 @@ from scipy.interpolate import interp1d
 from scipy.signal import savgol_filter
 from scipy.version import version as _scipy_version
 from phoebe.constraints.builtin import t0_supconj_to_perpass
+from phoebe.utils import _version_tuple
 from copy import deepcopy
-from distutils.version import LooseVersion
+
+# deepcopy is needed for scipy < 1.2.2 because of this bug: https://github.com/scipy/scipy/issues/9964
+_newton_modifies_x0 = _version_tuple(_scipy_version) < (1, 2, 2)
 
 # if os.getenv('PHOEBE_ENABLE_PLOTTING', 'TRUE').upper() == 'TRUE':
 #     try:
@@ -161,9 +164,8 @@ def ecc_anomaly(x, phases, ph0, ecc):
 def rv_model(phases, P, per0, ecc, asini, vgamma, ph_supconj, component=1):
 
     ph0 = t0_supconj_to_perpass(ph_supconj, 1., ecc, per0, 0., 0., 0.)
-    # deepcopy is needed for scipy < 1.2.2 because of this bug: https://github.com/scipy/scipy/issues/9964
     Es = newton(ecc_anomaly,
-                deepcopy(phases) if LooseVersion(_scipy_version) < LooseVersion("1.2.2") else phases,
+                deepcopy(phases) if _newton_modifies_x0 else phases,
                 args=(phases, ph0*np.ones_like(phases), ecc*np.ones_like(phases)))
 
     thetas = 2*np.arctan(((1+ecc)/(1-ecc))**0.5*np.tan(Es/2))
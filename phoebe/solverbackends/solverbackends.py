@@ -15,12 +15,11 @@ from phoebe import u, c
 from phoebe import conf, mpi
 from phoebe.parameters.parameters import _extract_index_from_string
 from phoebe.backend.backends import _simplify_error_message
-from phoebe.utils import phase_mask_inds
+from phoebe.utils import phase_mask_inds, _version_tuple
 from phoebe.dependencies import nparray
 from phoebe.helpers import get_emcee_object as _get_emcee_object
 from phoebe import pool as _pool
 
-from distutils.version import LooseVersion, StrictVersion
 from copy import deepcopy as _deepcopy
 import multiprocessing
 import pickle
@@ -546,7 +545,7 @@ class BaseSolverBackend(object):
         if mpi.enabled and self._allow_mpi:
             # broadcast the packet to ALL workers
             logger.debug("rank:{}/{} broadcasting to all workers".format(mpi.myrank, mpi.nprocs))
-            mpi.comm.bcast(packet, root=0)
+            mpi.bcast(packet)
 
             # now even the master can become a worker and take on a chunk
             rpacketlists_per_worker = [self.run_worker(**packet)]
@@ -1337,7 +1336,7 @@ class EmceeBackend(BaseSolverBackend):
             raise ImportError("could not import emcee.  Install (pip install emcee) and restart phoebe.")
 
         try:
-            if LooseVersion(emcee.__version__) < LooseVersion("3.0.0"):
+            if _version_tuple(emcee.__version__) < (3, 0, 0):
                 raise ImportError("emcee backend requires emcee 3.0+, {} found.  Update emcee and restart phoebe.".format(emcee.__version__))
         except ValueError:
             # see https://github.com/phoebe-project/phoebe2/issues/378
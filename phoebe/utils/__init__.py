@@ -1,6 +1,7 @@
 import logging
 
 import sys
+import re
 
 import numpy as np
 
@@ -13,6 +14,29 @@ logger.addHandler(logging.NullHandler())
 def _bytes(s):
     return bytes(s, 'utf-8')
 
+def _version_tuple(version, ncomponents=3):
+    """
+    Convert a version string (ie. '1.2.3' or '3.0rc2') to a tuple of integers
+    which can be compared directly, padded with zeros to at least ncomponents.
+    Anything after the numeric release components is ignored.
+
+    Raises ValueError if version does not start with an integer.
+    """
+    components = []
+    for component in version.split('.'):
+        match = re.match(r'\d+', component)
+        if match is None:
+            break
+        components.append(int(match.group()))
+        if match.end() < len(component):
+            # non-numeric suffix (ie. 'rc2'), nothing after this is compared
+            break
+
+    if not len(components):
+        raise ValueError("could not parse version '{}'".format(version))
+
+    return tuple(components + [0]*(ncomponents-len(components)))
+
 def get_basic_logger(clevel='WARNING',flevel='DEBUG',
                      style="default",filename=None,filemode='w'):
     """
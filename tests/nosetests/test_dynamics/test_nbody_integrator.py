@@ -0,0 +1,72 @@
+"""
+"""
+
+import phoebe
+from phoebe import c
+from phoebe.dynamics import nbody
+import numpy as np
+
+
+G = c.G.to('AU3 / (Msun d2)').value
+
+# hierarchical triple: an inner binary (P~8.6d) in a wide orbit (P~241d)
+# with a third star.  The orbital elements are given per star (the first
+# entry is ignored), as in dynamics_from_bundle.
+masses = [1.0*G, 0.8*G, 0.5*G]
+smas = [0.1, 0.1, 1.0]
+eccs = [0.1, 0.1, 0.2]
+incls = [1.2, 1.2, 1.0]
+per0s = [0.3, 0.3, 1.0]
+long_ans = [0.1, 0.1, 0.5]
+mean_anoms = [0.5, 0.5, 2.0]
+
+P_inner = 2*np.pi*np.sqrt(smas[1]**3 / (masses[0]+masses[1]))
+P_outer = 2*np.pi*np.sqrt(smas[2]**3 / sum(masses))
+
+
+def test_auto_choice():
+    # gr and ltte are off and all eccentricities are below 0.5: WHFast with
+    # 20 steps per inner orbit
+    integrator, stepsize = nbody._auto_integrator(masses, smas, eccs, 0.01)
+    assert(integrator == 'whfast')
+    assert(np.isclose(stepsize, P_inner/20., rtol=1e-12, atol=0))
+
+    # the same with the orbital elements given per orbit (use_kepcart)
+    integrator, stepsize = nbody._auto_integrator(masses, smas[1:], eccs[1:], 0.01)
+    assert(integrator == 'whfast')
+    assert(np.isclose(stepsize, P_inner/20., rtol=1e-12, atol=0))
+
+    # otherwise fall back on IAS15 with the provided stepsize
+    assert(nbody._auto_integrator(masses, smas, eccs, 0.01, ltte=True) == ('ias15', 0.01))
+    assert(nbody._auto_integrator(masses, smas, eccs, 0.01, gr=True) == ('ias15', 0.01))
+    assert(nbody._auto_integrator(masses, smas, [0.1, 0.1, 0.6], 0.01) == ('ias15', 0.01))
+
+
+def test_auto_v_ias15(plot=False):
+    if not nbody._can_rebound:
+        return
+
+    # one full outer orbit (~28 inner orbits)
+    times = np.linspace(0, P_outer, 2001)
+    args = (times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms)
+
+    auto = nbody.dynamics(*args, integrator='auto')
+    ias15 = nbody.dynamics(*args, integrator='ias15')
+
+    assert(np.allclose(auto[0], ias15[0], rtol=0, atol=1e-12))
+
+    # xs, ys, zs [solRad] then vxs, vys, vzs [solRad/d] per star.  With 20
+    # steps per inner orbit, WHFast stays within 1e-3 solRad (and solRad/d)
+    # of IAS15 for an inner separation of ~21.5 solRad.
+    for q_auto, q_ias15 in zip(auto[1:], ias15[1:]):
+        for qi_auto, qi_ias15 in zip(q_auto, q_ias15):
+            if plot:
+                print("max abs diff: {}".format(abs(qi_auto-qi_ias15).max()))
+            assert(np.allclose(qi_auto, qi_ias15, rtol=0, atol=1e-3))
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_auto_choice()
+    test_auto_v_ias15(plot=True)
@@ -0,0 +1,39 @@
+"""
+"""
+
+import phoebe
+from phoebe import c
+from phoebe.dynamics import nbody
+import numpy as np
+
+
+def _dynamics(times):
+    G = c.G.to('AU3 / (Msun d2)').value
+    # the orbital elements of the first particle are ignored
+    return nbody.dynamics(times, [1.0*G, 0.8*G], [2.0]*2, [0.2]*2, [1.2]*2,
+                          [0.3]*2, [0.1]*2, [0.5]*2)
+
+
+def test_serialize_fallback():
+    if not nbody._can_rebound:
+        return
+
+    times = np.linspace(0, 10, 11)
+    serialized = _dynamics(times)
+
+    # older versions of rebound do not provide serialize_particle_data
+    serialize_particle_data = nbody.rebound.Simulation.serialize_particle_data
+    del nbody.rebound.Simulation.serialize_particle_data
+    try:
+        per_particle = _dynamics(times)
+    finally:
+        nbody.rebound.Simulation.serialize_particle_data = serialize_particle_data
+
+    for q_serialized, q_per_particle in zip(serialized, per_particle):
+        assert(np.array_equal(q_serialized, q_per_particle))
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_serialize_fallback()
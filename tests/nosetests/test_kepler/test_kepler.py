@@ -0,0 +1,65 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+from phoebe.dynamics.keplerian import _true_anomaly
+
+
+def test_kepler_equation(plot=False):
+    # several revolutions in both directions to test the range reduction
+    M = np.linspace(-20, 40, 10001)
+
+    for ecc in [0.0, 1e-8, 0.01, 0.3, 0.7, 0.95, 0.999]:
+        E, theta = _true_anomaly(M, ecc)
+        residual = E - ecc*np.sin(E) - M
+
+        if plot:
+            print("ecc={} max abs residual: {}".format(ecc, abs(residual).max()))
+
+        assert(np.allclose(residual, 0.0, rtol=0, atol=1e-12))
+
+        # the true anomaly must agree with the eccentric anomaly
+        assert(np.allclose(np.cos(theta), (np.cos(E)-ecc)/(1-ecc*np.cos(E))))
+        assert(np.all(np.sign(np.sin(theta)) == np.sign(np.sin(E))))
+
+    # scalar input
+    E, theta = _true_anomaly(1.0, 0.3)
+    assert(np.isscalar(E) and np.isscalar(theta))
+    assert(abs(E - 0.3*np.sin(E) - 1.0) < 1e-12)
+
+    # array of eccentricities (ie. with deccdt != 0)
+    ecc = np.linspace(0, 0.9, len(M))
+    E, theta = _true_anomaly(M, ecc)
+    assert(np.allclose(E - ecc*np.sin(E) - M, 0.0, rtol=0, atol=1e-12))
+
+
+def test_kepler_equation_relative(plot=False):
+    # close to periastron and apastron the residual must be small compared to
+    # M itself, not just in absolute terms
+    dM = np.array([1e-300, 1e-20, 1e-12, 1e-8, 1e-6, 1e-3])
+    M = np.concatenate([dM, -dM, np.pi-dM, -(np.pi-dM), [np.pi, -np.pi]])
+
+    for ecc in [0.0, 0.2, 0.5, 0.9, 0.99]:
+        E, theta = _true_anomaly(M, ecc)
+        residual = (E - ecc*np.sin(E) - M) / M
+
+        if plot:
+            print("ecc={} max rel residual: {}".format(ecc, abs(residual).max()))
+
+        assert(np.allclose(residual, 0.0, rtol=0, atol=1e-13))
+        assert(np.all(np.sign(E) == np.sign(M)))
+
+        # as M -> 0, E -> M/(1-e)
+        assert(np.allclose(E[:3], M[:3]/(1-ecc), rtol=1e-14, atol=0))
+
+    E, theta = _true_anomaly(1e-20, 0.2)
+    assert(abs(E/1.25e-20 - 1) < 1e-14)
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_kepler_equation(plot=True)
+    test_kepler_equation_relative(plot=True)
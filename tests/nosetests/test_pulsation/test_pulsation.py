@@ -0,0 +1,101 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import universe
+from phoebe.backend.universe import Pulsation
+import numpy as np
+
+
+def test_spherical_harmonics(plot=False):
+    theta = np.linspace(0.1, np.pi-0.1, 21)
+    phi = np.linspace(-np.pi, np.pi, 21)
+
+    # closed forms (including the Condon-Shortley phase) of Y_lm
+    expected = {(0, 0): 0.5*np.sqrt(1./np.pi) * np.ones_like(theta),
+                (1, 0): 0.5*np.sqrt(3./np.pi) * np.cos(theta),
+                (1, 1): -0.5*np.sqrt(1.5/np.pi) * np.sin(theta) * np.exp(1j*phi),
+                (2, -1): 0.5*np.sqrt(7.5/np.pi) * np.sin(theta) * np.cos(theta) * np.exp(-1j*phi),
+                (2, 2): 0.25*np.sqrt(7.5/np.pi) * np.sin(theta)**2 * np.exp(2j*phi),
+                (2, -2): 0.25*np.sqrt(7.5/np.pi) * np.sin(theta)**2 * np.exp(-2j*phi)}
+
+    for (l, m), Y_exp in expected.items():
+        Y = Pulsation(0.01, 1.0, l=l, m=m).spherical_harmonics(theta, phi)
+
+        if plot:
+            print("l={} m={} max abs(Y): {}".format(l, m, abs(Y-Y_exp).max()))
+
+        assert(np.allclose(Y, Y_exp))
+
+def test_basis_reuse(plot=False):
+    pulsation = Pulsation(0.01, 2.0, l=2, m=1)
+
+    theta, phi = np.meshgrid(np.linspace(0.1, np.pi-0.1, 10), np.linspace(-np.pi, np.pi, 10))
+    theta, phi = theta.flatten(), phi.flatten()
+    coords = np.array([np.sin(theta)*np.cos(phi), np.sin(theta)*np.sin(phi), np.cos(theta)]).T
+
+    Y = pulsation.spherical_harmonics(theta, phi)
+
+    mesh = object()
+    basis = None
+    for t in [0.0, 0.1, 0.35]:
+        pulsation.process_standard_mesh(mesh, coords)
+        new_coords = pulsation.process_coords_for_computations(coords, s=None, t=t)
+        new_coords_obs = pulsation.process_coords_for_observations(new_coords, coords, s=None, t=t)
+
+        if basis is not None:
+            # mesh did not change, so the basis should not be re-evaluated
+            assert(pulsation._basis is basis)
+        basis = pulsation._basis
+
+        xi_r = (0.01 * Y * np.exp(-1j*2*np.pi*2.0*t)).real
+        if plot:
+            print("t={} max abs: {}".format(t, abs(new_coords - coords*(1+xi_r[:,None])).max()))
+
+        assert(np.allclose(new_coords, coords*(1+xi_r[:,None])))
+        assert(np.allclose(new_coords_obs, new_coords))
+
+    # a new mesh requires a new basis
+    pulsation.process_standard_mesh(object(), coords)
+    assert(pulsation._basis is not basis)
+
+def test_multiple_modes(plot=False):
+    b = phoebe.default_star()
+    system = universe.System.from_bundle(b, b.computes[0])
+    body = system.bodies[0]
+
+    pulsations = [Pulsation(0.01, 1.0, l=0, m=0), Pulsation(0.01, 3.0, l=2, m=1)]
+    body.features += pulsations
+
+    nbuilds = {id(pulsation): 0 for pulsation in pulsations}
+    nevals = {id(pulsation): 0 for pulsation in pulsations}
+    for pulsation in pulsations:
+        def _prepare_basis(coords, pulsation=pulsation, _prepare_basis=pulsation._prepare_basis):
+            nbuilds[id(pulsation)] += 1
+            return _prepare_basis(coords)
+        pulsation._prepare_basis = _prepare_basis
+
+        # Y_lm (and with it exp(i m phi)) should only be evaluated with the basis
+        def spherical_harmonics(theta, phi, pulsation=pulsation, spherical_harmonics=pulsation.spherical_harmonics):
+            nevals[id(pulsation)] += 1
+            return spherical_harmonics(theta, phi)
+        pulsation.spherical_harmonics = spherical_harmonics
+
+    for t in np.linspace(0, 1, 11):
+        system.update_positions(t, [0.], [0.], [0.], [0.], [0.], [0.], [0.], [0.], [0.])
+
+    if plot:
+        print("basis evaluations per mode: {}".format(list(nbuilds.values())))
+
+    # each mode is displacing coordinates already displaced by the other, but
+    # the (undisplaced) mesh does not change, so each basis is built once
+    assert(list(nbuilds.values()) == [1, 1])
+    assert(list(nevals.values()) == [1, 1])
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_spherical_harmonics(plot=True)
+    test_basis_reuse(plot=True)
+    test_multiple_modes(plot=True)
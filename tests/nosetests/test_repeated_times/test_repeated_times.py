@@ -0,0 +1,37 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_binary(plot=False):
+    b = phoebe.default_binary()
+
+    # 0.1 is repeated in both datasets
+    times = [0, 0.1, 0.1, 0.2]
+    b.add_dataset('lc', times=times, dataset='lc01')
+    b.add_dataset('rv', times=times, dataset='rv01')
+
+    b.run_compute(irrad_method='none', model='repeated')
+
+    b.set_value('times', dataset='lc01', context='dataset', value=[0, 0.1, 0.2])
+    b.set_value_all('times', dataset='rv01', context='dataset', value=[0, 0.1, 0.2])
+    b.run_compute(irrad_method='none', model='unique')
+
+    fluxes = b.get_value('fluxes', model='repeated')
+    if plot:
+        print("fluxes: {}".format(fluxes))
+    assert(np.allclose(fluxes, b.get_value('fluxes', model='unique')[[0, 1, 1, 2]], rtol=0, atol=1e-12))
+
+    for comp in ['primary', 'secondary']:
+        rvs = b.get_value('rvs', component=comp, model='repeated')
+        if plot:
+            print("rvs@{}: {}".format(comp, rvs))
+        assert(np.allclose(rvs, b.get_value('rvs', component=comp, model='unique')[[0, 1, 1, 2]], rtol=0, atol=1e-12))
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_binary(plot=True)
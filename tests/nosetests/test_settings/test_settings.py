@@ -0,0 +1,31 @@
+"""
+"""
+
+import phoebe
+import os
+
+
+def test_reset_rereads_environment():
+    devel = os.environ.get('PHOEBE_DEVEL', None)
+    try:
+        os.environ['PHOEBE_DEVEL'] = 'TRUE'
+        phoebe.reset_settings()
+        assert(phoebe.conf.devel)
+
+        # the parsed environment variables are cached, but reset must still
+        # pick up the change
+        os.environ['PHOEBE_DEVEL'] = 'FALSE'
+        phoebe.reset_settings()
+        assert(not phoebe.conf.devel)
+    finally:
+        if devel is None:
+            os.environ.pop('PHOEBE_DEVEL', None)
+        else:
+            os.environ['PHOEBE_DEVEL'] = devel
+        phoebe.reset_settings()
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_reset_rereads_environment()